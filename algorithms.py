@@ -14,9 +14,133 @@ for visualization purposes.
 """
 
 from collections import deque
-from typing import Tuple, List, Set, Dict, Optional, Union
+from itertools import compress
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, List, Set, Dict, Optional, Union, Callable, Iterator, Sequence
 from grid import Grid
-import heapq
+
+
+# Per-node status bits used by bidirectional search
+FWD_EXPLORED = 1
+BWD_EXPLORED = 2
+FWD_FRONT = 4
+BWD_FRONT = 8
+
+# bytes.translate table mapping a status byte to 1 if either search explored the node
+_EXPLORED_TABLE = bytes(1 if bits & (FWD_EXPLORED | BWD_EXPLORED) else 0 for bits in range(256))
+
+
+class FrontierLog:
+    """
+    Incremental record of how the frontier changes during a search.
+    
+    Instead of copying the whole frontier on every step, the log keeps two flat
+    event lists (nodes pushed, nodes removed) and, per step, only where each list
+    ended when the step was recorded. Recording a step is two appends; the sets
+    are built only when a snapshot is actually requested, by replaying the events
+    from the nearest checkpoint, so indexing behaves like the old list of sets.
+    """
+    
+    # Number of steps between cached snapshots used as replay starting points
+    CHECKPOINT_INTERVAL = 256
+    
+    def __init__(self, initial: Tuple = (), decode: Optional[Callable] = None):
+        """
+        Initialize an empty log.
+        
+        Args:
+            initial: Nodes that are in the frontier before the first step
+            decode: Optional function converting logged nodes to positions in snapshots
+        """
+        self.decode = decode
+        
+        # Every push and removal in order; the initial nodes count as pushed before step 0
+        self._added: List = list(initial)
+        self._removed: List = []
+        
+        # Length of each event list at the end of every step (step i spans [i, i + 1))
+        self._added_ends: List[int] = [0]
+        self._removed_ends: List[int] = [0]
+        
+        # Frontier contents (node -> number of copies) before step i * CHECKPOINT_INTERVAL
+        self._checkpoints: List[Dict] = [{}]
+    
+    def push(self, node) -> None:
+        """Note that a node entered the frontier."""
+        self._added.append(node)
+    
+    def remove(self, node) -> None:
+        """Note that a node left the frontier (popped or blocked)."""
+        self._removed.append(node)
+    
+    def record(self) -> None:
+        """Close the current step, marking where its changes end."""
+        self._added_ends.append(len(self._added))
+        self._removed_ends.append(len(self._removed))
+    
+    def _apply(self, counts: Dict, first: int, last: int) -> None:
+        """
+        Apply the changes of recorded steps first..last - 1 to a node-count map in place.
+        
+        All pushes of the range are applied before its removals, which gives the
+        same counts as replaying step by step since every removal follows its push.
+        """
+        for node in self._added[self._added_ends[first]:self._added_ends[last]]:
+            counts[node] = counts.get(node, 0) + 1
+        for node in self._removed[self._removed_ends[first]:self._removed_ends[last]]:
+            remaining = counts[node] - 1
+            if remaining:
+                counts[node] = remaining
+            else:
+                del counts[node]
+    
+    def _to_set(self, counts: Dict) -> Set:
+        """Turn a node-count map into a set of nodes (decoded if configured)."""
+        if self.decode is None:
+            return set(counts)
+        return {self.decode(node) for node in counts}
+    
+    def snapshot(self, step: int) -> Set:
+        """
+        Rebuild the frontier as it was at a given step.
+        
+        Args:
+            step: Index of the recorded step
+            
+        Returns:
+            Set of nodes in the frontier at that step
+        """
+        interval = self.CHECKPOINT_INTERVAL
+        checkpoint = (step + 1) // interval
+        
+        # Extend the checkpoint cache up to the one we need
+        while len(self._checkpoints) <= checkpoint:
+            counts = self._checkpoints[-1].copy()
+            first = (len(self._checkpoints) - 1) * interval
+            self._apply(counts, first, first + interval)
+            self._checkpoints.append(counts)
+            
+        # Replay the remaining steps on a copy of the checkpoint
+        counts = self._checkpoints[checkpoint].copy()
+        self._apply(counts, checkpoint * interval, step + 1)
+        return self._to_set(counts)
+    
+    def __len__(self) -> int:
+        return len(self._added_ends) - 1
+    
+    def __getitem__(self, step: int) -> Set:
+        if step < 0:
+            step += len(self)
+        if not 0 <= step < len(self):
+            raise IndexError("frontier log index out of range")
+        return self.snapshot(step)
+    
+    def __iter__(self):
+        # Replay sequentially instead of rebuilding every snapshot from a checkpoint
+        counts: Dict = {}
+        for i in range(len(self)):
+            self._apply(counts, i, i + 1)
+            yield self._to_set(counts)
 
 
 class SearchResult:
@@ -35,7 +159,7 @@ class SearchResult:
     def __init__(self):
         self.path: List[Tuple[int, int]] = []
         self.explored: Set[Tuple[int, int]] = set()
-        self.frontier_history: List[Set[Tuple[int, int]]] = []
+        self.frontier_history: Union[FrontierLog, List[Set[Tuple[int, int]]]] = []
         self.total_nodes_explored: int = 0
         self.found: bool = False
         self.dynamic_obstacles_encountered: List[Tuple[int, int]] = []
@@ -44,135 +168,218 @@ class SearchResult:
 class SearchAlgorithm:
     """Base class for all search algorithms."""
     
-    def __init__(self, grid: Grid):
+    def __init__(self, grid: Grid, capture_frontier: bool = False):
         """
         Initialize search algorithm.
         
         Args:
             grid: Grid object to search on
+            capture_frontier: Whether to log the frontier at every step for visualization
         """
         self.grid = grid
-        self.explored: Set[Tuple[int, int]] = set()
-        self.parent_map: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
-        self.frontier_history: List[Set[Tuple[int, int]]] = []
+        self.capture_frontier = capture_frontier
+        
+        # Nodes are tracked by integer id (see Grid.encode) and decoded for results
+        self.explored: Union[Set[int], bytearray] = set()
+        # Parent of every node id, -1 for the start node and unreached nodes
+        self.parent_map: List[int] = []
+        # All -1 template copied into parent arrays to clear them between searches
+        self._no_parents: List[int] = []
+        self.frontier_history: Union[FrontierLog, List[Set[Tuple[int, int]]]] = []
         self.dynamic_obstacles_encountered: List[Tuple[int, int]] = []
+        
+        # Obstacle check for this algorithm's frontier layout. Subclasses pick one of
+        # the _check_obstacles_* methods once here, so no per-item type probing is needed.
+        self._check_obstacles: Callable[..., Optional[Tuple[int, int]]] = self._check_obstacles_deque
+    
+    def reset(self) -> None:
+        """
+        Clear the state left by a previous search so the algorithm can run again.
+        
+        The parent array is cleared in place and reused; it is only allocated
+        on the first search or when the grid size changes. The frontier history
+        and obstacle list are handed to the returned SearchResult, so they are
+        replaced rather than cleared to keep earlier results valid.
+        """
+        size = self.grid.width * self.grid.height
+        if len(self._no_parents) != size:
+            self._no_parents = [-1] * size
+        
+        self.explored = set()
+        self.parent_map = self._cleared_parents(self.parent_map)
+        self.frontier_history = []
+        self.dynamic_obstacles_encountered = []
+    
+    def _cleared_parents(self, parents: List[int]) -> List[int]:
+        """
+        Reset a parent array to -1 for every node, reusing it when possible.
+        
+        Args:
+            parents: Parent array left by a previous search (may be empty)
+            
+        Returns:
+            The same list refilled in place, or a new one if its size does not
+            match the grid
+        """
+        if len(parents) != len(self._no_parents):
+            return self._no_parents.copy()
+        parents[:] = self._no_parents
+        return parents
     #pthon is good hehe 
-    def _reconstruct_path(self, current: Tuple[int, int]) -> List[Tuple[int, int]]:
+    def _reconstruct_path(self, current: int) -> List[Tuple[int, int]]:
         """
-        Reconstruct the path from start to current position using parent map.
+        Reconstruct the path from start to current node using the parent array.
         
         Args:
-            current: Current position
+            current: Current node id
             
         Returns:
             List of positions from start to current
         """
         path = []
-        pos = current
+        node = current
+        parent_map = self.parent_map
+        decode = self.grid.decode
         
         # Trace back from current to start using parent pointers
-        while pos is not None:
-            path.append(pos)
-            pos = self.parent_map.get(pos)
+        while node != -1:
+            path.append(decode(node))
+            node = parent_map[node]
         
         # Reverse to get path from start to current
         path.reverse()
         return path
     
-    def _check_dynamic_obstacles(self, frontier: Union[List, deque, Set]) -> Optional[Tuple[int, int]]:
+    def _explored_positions(self) -> Set[Tuple[int, int]]:
         """
-        Check if any dynamic obstacles have spawned and handle them.
+        Return the explored nodes as a set of (x, y) positions.
         
-        For dynamic environments, if an obstacle blocks a node in the frontier,
-        that node must be removed to trigger replanning.
+        The explored nodes are either a set of node ids or a bytearray of
+        per-node flags indexed by node id. For flags, compress() skips the
+        unexplored cells in C, so only explored nodes reach Python.
+        """
+        decode = self.grid.decode
+        if isinstance(self.explored, bytearray):
+            return set(map(decode, compress(range(len(self.explored)), self.explored)))
+        return {decode(node) for node in self.explored}
+    
+    def _spawn_obstacle(self) -> Optional[Tuple[int, int]]:
+        """
+        Give the grid a chance to spawn a dynamic obstacle and record it.
+            
+        Returns:
+            New obstacle position if spawned, None otherwise
+        """
+        new_obstacle = self.grid.spawn_dynamic_obstacle()
+        if new_obstacle is not None:
+            self.dynamic_obstacles_encountered.append(new_obstacle)
+        return new_obstacle
+    
+    def _check_obstacles_deque(self, *frontiers: deque) -> Optional[Tuple[int, int]]:
+        """
+        Check for a new dynamic obstacle and drop it from FIFO frontiers.
         
-        Handles different data structures:
-        - deque: For BFS and Bidirectional search
-        - list: For DFS, UCS (priority queue), and DLS
-        - set: For set-based frontiers
+        Used by BFS and Bidirectional search, whose frontiers hold plain node ids.
+        If an obstacle blocks a node in the frontier, that node must be removed
+        to trigger replanning. Blocked cells are never pushed and earlier obstacles
+        were already removed, so only the new obstacle's cell has to be looked for;
+        the frontiers are filtered in place and left untouched if it is not there.
         
         Args:
-            frontier: Current frontier (queue/stack/set)
+            frontiers: Current frontier queues (both directions for Bidirectional)
             
         Returns:
             New obstacle position if spawned, None otherwise
         """
-        # Check if a new dynamic obstacle has spawned
-        new_obstacle = self.grid.spawn_dynamic_obstacle()
-        if new_obstacle:
-            self.dynamic_obstacles_encountered.append(new_obstacle)
+        new_obstacle = self._spawn_obstacle()
+        if new_obstacle is None:
+            return None
+        
+        node = self.grid.encode(new_obstacle)
+        for frontier in frontiers:
+            while node in frontier:
+                frontier.remove(node)
+                if self.capture_frontier:
+                    self.frontier_history.remove(node)
+        return new_obstacle
+        
+    def _check_obstacles_stack(self, frontier: List[int]) -> Optional[Tuple[int, int]]:
+        """
+        Check for a new dynamic obstacle and drop blocked nodes from a LIFO frontier.
+        
+        Used by DFS, whose stack holds plain node ids. As for the FIFO frontier,
+        only the new obstacle's cell can be on the stack.
+        
+        Args:
+            frontier: Current frontier stack
             
-            # Remove blocked nodes from frontier based on data structure type
-            if isinstance(frontier, deque):
-                # For queue-based searches (BFS, Bidirectional)
-                frontier_list = list(frontier)
-                frontier.clear()
-                for item in frontier_list:
-                    if not self.grid.is_blocked(item):
-                        frontier.append(item)
-                        
-            elif isinstance(frontier, list):
-                # For stack-based and priority-based searches (DFS, UCS, DLS)
-                frontier_copy = frontier.copy()
-                frontier.clear()
-                for item in frontier_copy:
-                    # Extract node from wrapped formats
-                    node = self._extract_node_from_item(item)
-                    if node:
-                        # Item is wrapped (UCS or DLS format)
-                        if not self.grid.is_blocked(node):
-                            frontier.append(item)
-                    else:
-                        # Item is a plain node tuple
-                        if not self.grid.is_blocked(item):
-                            frontier.append(item)
-                            
-            elif isinstance(frontier, set):
-                # For set-based frontiers
-                blocked_items = {item for item in frontier 
-                               if self.grid.is_blocked(self._extract_node_from_item(item) or item)}
-                frontier.difference_update(blocked_items)
+        Returns:
+            New obstacle position if spawned, None otherwise
+        """
+        new_obstacle = self._spawn_obstacle()
+        if new_obstacle is None:
+            return None
+            
+        node = self.grid.encode(new_obstacle)
+        while node in frontier:
+            frontier.remove(node)
+            if self.capture_frontier:
+                self.frontier_history.remove(node)
+        return new_obstacle
+    
+    def _check_obstacles_ucs(self, frontier: List[deque]) -> Optional[Tuple[int, int]]:
+        """
+        Check for a new dynamic obstacle and drop blocked nodes from the UCS bucket queue.
         
+        The frontier is a list of FIFO buckets, one per path cost. Only the new
+        obstacle's cell can be queued, so each bucket is searched for it and
+        filtered in place.
+        
+        Args:
+            frontier: Current cost buckets
+            
+        Returns:
+            New obstacle position if spawned, None otherwise
+        """
+        new_obstacle = self._spawn_obstacle()
+        if new_obstacle is None:
+            return None
+            
+        node = self.grid.encode(new_obstacle)
+        for bucket in frontier:
+            while node in bucket:
+                bucket.remove(node)
+                if self.capture_frontier:
+                    self.frontier_history.remove(node)
         return new_obstacle
     
-    def _extract_node_from_item(self, item) -> Optional[Tuple[int, int]]:
+    def _check_obstacles_dls(self, frontier: List[int], depths: List[int]) -> Optional[Tuple[int, int]]:
         """
-        Extract node coordinates from different frontier item formats.
+        Check for a new dynamic obstacle and drop blocked entries from the DLS stack.
         
-        Different algorithms wrap nodes differently:
-        - BFS/DFS: (x, y) - plain node tuple
-        - UCS: (cost, counter, (x, y)) - priority queue format
-        - DLS: ((x, y), depth) - node with depth tracking
+        The stack is kept as two parallel lists of node ids and their depths.
+        Only the new obstacle's cell can be on the stack, so its entries are
+        deleted from both lists in place.
         
         Args:
-            item: Frontier item (node or wrapped node)
+            frontier: Node ids on the frontier stack
+            depths: Depth of each node on the stack
             
         Returns:
-            Node tuple (x, y) or None if item is already a plain node
-        """
-        # UCS format: (cost, counter, node)
-        if isinstance(item, tuple) and len(item) == 3:
-            if isinstance(item[2], tuple) and len(item[2]) == 2:
-                try:
-                    # Verify it's a valid coordinate pair
-                    if isinstance(item[2][0], int) and isinstance(item[2][1], int):
-                        return item[2]
-                except (TypeError, IndexError):
-                    pass
-        
-        # DLS format: (node, depth)
-        if isinstance(item, tuple) and len(item) == 2:
-            # Check if first element is a node tuple
-            if isinstance(item[0], tuple) and len(item[0]) == 2:
-                try:
-                    # Verify second element is depth (int)
-                    if isinstance(item[1], int) and item[1] >= 0:
-                        return item[0]
-                except (TypeError, IndexError):
-                    pass
-        
-        # Plain node format: (x, y) - return None to signal it's already a node
-        return None
+            New obstacle position if spawned, None otherwise
+        """
+        new_obstacle = self._spawn_obstacle()
+        if new_obstacle is None:
+            return None
+            
+        node = self.grid.encode(new_obstacle)
+        while node in frontier:
+            index = frontier.index(node)
+            del frontier[index]
+            del depths[index]
+            if self.capture_frontier:
+                self.frontier_history.remove(node)
+        return new_obstacle
     
     def search(self) -> SearchResult:
         """
@@ -196,55 +403,109 @@ class BreadthFirstSearch(SearchAlgorithm):
     Best for: Finding shortest path in unweighted graphs
     """
     
+    def __init__(self, grid: Grid, capture_frontier: bool = False):
+        """
+        Initialize BFS.
+        
+        Args:
+            grid: Grid object to search on
+            capture_frontier: Whether to log the frontier at every step for visualization
+        """
+        super().__init__(grid, capture_frontier)
+        self._check_obstacles = self._check_obstacles_deque
+    
     def search(self) -> SearchResult:
         """Execute Breadth-First Search."""
+        self.reset()
         result = SearchResult()
         
+        # Static adjacency (CSR) and live blocked flags, indexed by node id
+        offsets, flat = self.grid.build_csr()
+        blocked = self.grid.occ
+        start = self.grid.encode(self.grid.start)
+        target = self.grid.encode(self.grid.target)
+        
         # Initialize frontier with start node (FIFO queue)
-        frontier = deque([self.grid.start])
-        self.explored = set()
-        self.parent_map[self.grid.start] = None
+        frontier = deque([start])
+        explored = self.explored = bytearray(len(blocked))
+        
+        # Frontier changes are only logged when capture_frontier is set
+        capture = self.capture_frontier
+        if capture:
+            self.frontier_history = FrontierLog(frontier, self.grid.decode)
+            record = self.frontier_history.record
+            push = self.frontier_history.push
+            remove = self.frontier_history.remove
         
         # Track nodes currently in frontier to avoid duplicates
-        in_frontier: Set[Tuple[int, int]] = {self.grid.start}
+        in_frontier = bytearray(len(blocked))
+        in_frontier[start] = 1
+        
+        # Bind attributes and methods used in the loop to locals
+        parent_map = self.parent_map
+        check_obstacles = self._check_obstacles
+        popleft = frontier.popleft
+        append = frontier.append
         
         while frontier:
-            # Check for new dynamic obstacles
-            self._check_dynamic_obstacles(frontier)
+            # Check for new dynamic obstacles; stop if they removed the last frontier node
+            check_obstacles(frontier)
+            if not frontier:
+                break
             
             # Save current frontier state for visualization
-            self.frontier_history.append(set(frontier))
+            if capture:
+                record()
             
             # Get next node (First In First Out)
-            current = frontier.popleft()
-            in_frontier.discard(current)
+            current = popleft()
+            in_frontier[current] = 0
+            if capture:
+                remove(current)
             
             # Skip if already explored (can happen with dynamic obstacles)
-            if current in self.explored:
+            if explored[current]:
                 continue
             
             # Mark node as explored NOW (not when adding to frontier)
-            self.explored.add(current)
+            explored[current] = 1
             
-            # Check if we reached the target
-            if current == self.grid.target:
+            # Check if we reached the target (only the start node can match here,
+            # every other node is tested when it is generated below)
+            if current == target:
                 result.path = self._reconstruct_path(current)
                 result.found = True
                 break
             
-            # Explore all neighbors
-            neighbors = self.grid.get_neighbors(current)
-            for neighbor in neighbors:
+            # Explore all neighbors (skipping cells taken by dynamic obstacles).
+            # Each pop is its own step for obstacle spawning and the frontier log,
+            # so neighbors are expanded per node rather than a whole level at once.
+            for neighbor in flat[offsets[current]:offsets[current + 1]]:
+                if blocked[neighbor]:
+                    continue
                 # Only add if not explored and not in frontier
-                if neighbor not in self.explored and neighbor not in in_frontier:
-                    self.parent_map[neighbor] = current
-                    frontier.append(neighbor)
-                    in_frontier.add(neighbor)
+                if not explored[neighbor] and not in_frontier[neighbor]:
+                    parent_map[neighbor] = current
+                    
+                    # Goal test on generation: BFS already has the shortest path to the
+                    # target here, so there is no need to expand the rest of this level
+                    if neighbor == target:
+                        result.path = self._reconstruct_path(neighbor)
+                        result.found = True
+                        break
+                        
+                    append(neighbor)
+                    in_frontier[neighbor] = 1
+                    if capture:
+                        push(neighbor)
+                        
+            if result.found:
+                break
         
         # Store results
-        result.explored = self.explored.copy()
+        result.explored = self._explored_positions()
         result.frontier_history = self.frontier_history
-        result.total_nodes_explored = len(self.explored)
+        result.total_nodes_explored = len(result.explored)
         result.dynamic_obstacles_encountered = self.dynamic_obstacles_encountered
         
         return result
@@ -263,54 +524,94 @@ class DepthFirstSearch(SearchAlgorithm):
     Note: Does NOT guarantee shortest path
     """
     
+    def __init__(self, grid: Grid, capture_frontier: bool = False):
+        """
+        Initialize DFS.
+        
+        Args:
+            grid: Grid object to search on
+            capture_frontier: Whether to log the frontier at every step for visualization
+        """
+        super().__init__(grid, capture_frontier)
+        self._check_obstacles = self._check_obstacles_stack
+    
     def search(self) -> SearchResult:
         """Execute Depth-First Search."""
+        self.reset()
         result = SearchResult()
         
+        # Static adjacency (CSR) and live blocked flags, indexed by node id
+        offsets, flat = self.grid.build_csr()
+        blocked = self.grid.occ
+        start = self.grid.encode(self.grid.start)
+        target = self.grid.encode(self.grid.target)
+        
         # Initialize frontier with start node (LIFO stack)
-        frontier = [self.grid.start]
-        self.explored = set()
-        self.parent_map[self.grid.start] = None
+        frontier = [start]
+        explored = self.explored = bytearray(len(blocked))
+        
+        # Frontier changes are only logged when capture_frontier is set
+        capture = self.capture_frontier
+        if capture:
+            self.frontier_history = FrontierLog(frontier, self.grid.decode)
+            record = self.frontier_history.record
+            push = self.frontier_history.push
+            remove = self.frontier_history.remove
         
         # Track nodes in frontier
-        in_frontier: Set[Tuple[int, int]] = {self.grid.start}
+        in_frontier = bytearray(len(blocked))
+        in_frontier[start] = 1
+        
+        # Bind attributes and methods used in the loop to locals
+        parent_map = self.parent_map
+        check_obstacles = self._check_obstacles
+        pop = frontier.pop
+        append = frontier.append
         
         while frontier:
-            # Check for new dynamic obstacles
-            self._check_dynamic_obstacles(frontier)
+            # Check for new dynamic obstacles; stop if they removed the last frontier node
+            check_obstacles(frontier)
+            if not frontier:
+                break
             
             # Save frontier state for visualization
-            self.frontier_history.append(set(frontier))
+            if capture:
+                record()
             
             # Get next node (Last In First Out)
-            current = frontier.pop()
-            in_frontier.discard(current)
+            current = pop()
+            in_frontier[current] = 0
+            if capture:
+                remove(current)
             
             # Skip if already explored
-            if current in self.explored:
+            if explored[current]:
                 continue
             
             # Mark as explored NOW
-            self.explored.add(current)
+            explored[current] = 1
             
             # Check if target found
-            if current == self.grid.target:
+            if current == target:
                 result.path = self._reconstruct_path(current)
                 result.found = True
                 break
             
             # Add neighbors in reverse order (because stack reverses them)
-            neighbors = self.grid.get_neighbors(current)
-            for neighbor in reversed(neighbors):
-                if neighbor not in self.explored and neighbor not in in_frontier:
-                    self.parent_map[neighbor] = current
-                    frontier.append(neighbor)
-                    in_frontier.add(neighbor)
+            for neighbor in reversed(flat[offsets[current]:offsets[current + 1]]):
+                if blocked[neighbor]:
+                    continue
+                if not explored[neighbor] and not in_frontier[neighbor]:
+                    parent_map[neighbor] = current
+                    append(neighbor)
+                    in_frontier[neighbor] = 1
+                    if capture:
+                        push(neighbor)
         
         # Store results
-        result.explored = self.explored.copy()
+        result.explored = self._explored_positions()
         result.frontier_history = self.frontier_history
-        result.total_nodes_explored = len(self.explored)
+        result.total_nodes_explored = len(result.explored)
         result.dynamic_obstacles_encountered = self.dynamic_obstacles_encountered
         
         return result
@@ -323,67 +624,117 @@ class UniformCostSearch(SearchAlgorithm):
     Expands nodes with lowest path cost first using a priority queue.
     Guarantees finding the minimum cost path.
     
-    Time Complexity: O((V + E) * log V)
+    Every move costs 1, so the priority queue is a bucket queue (Dial's algorithm)
+    with one FIFO bucket per path cost rather than a binary heap. With unit costs
+    this expands nodes in the same order as BFS; a heap is only worth it once the
+    grid has truly weighted edges.
+    
+    Time Complexity: O(V + E)
     Space Complexity: O(V)
     Best for: Weighted graphs, finding minimum cost paths
     """
     
+    def __init__(self, grid: Grid, capture_frontier: bool = False):
+        """
+        Initialize UCS.
+        
+        Args:
+            grid: Grid object to search on
+            capture_frontier: Whether to log the frontier at every step for visualization
+        """
+        super().__init__(grid, capture_frontier)
+        self._check_obstacles = self._check_obstacles_ucs
+    
     def search(self) -> SearchResult:
         """Execute Uniform Cost Search."""
+        self.reset()
         result = SearchResult()
         
-        # Priority queue: (cost, counter, node)
-        # Counter ensures stable ordering when costs are equal
-        frontier = [(0, 0, self.grid.start)]
-        cost_map: Dict[Tuple[int, int], float] = {self.grid.start: 0}
-        self.explored = set()
-        self.parent_map[self.grid.start] = None
-        counter = 1
+        # Static adjacency (CSR) and live blocked flags, indexed by node id
+        offsets, flat = self.grid.build_csr()
+        blocked = self.grid.occ
+        start = self.grid.encode(self.grid.start)
+        target = self.grid.encode(self.grid.target)
         
-        while frontier:
+        # Bucket queue (Dial's algorithm): buckets[c] holds the nodes reached at cost c.
+        # Every edge costs 1, so the cheapest non-empty bucket only ever moves forward
+        # and push/pop are O(1) instead of O(log V) for a binary heap.
+        buckets: List[deque] = [deque([start])]
+        current_cost = 0
+        cost_map: Dict[int, int] = {start: 0}
+        explored = self.explored = bytearray(len(blocked))
+        
+        # Frontier changes are only logged when capture_frontier is set
+        capture = self.capture_frontier
+        if capture:
+            self.frontier_history = FrontierLog([start], self.grid.decode)
+            record = self.frontier_history.record
+            push = self.frontier_history.push
+            remove = self.frontier_history.remove
+        
+        # Bind attributes and methods used in the loop to locals
+        parent_map = self.parent_map
+        check_obstacles = self._check_obstacles
+        
+        while True:
             # Check for dynamic obstacles
-            self._check_dynamic_obstacles(frontier)
+            check_obstacles(buckets)
             
-            # Save frontier state (extract nodes from priority tuples)
-            self.frontier_history.append({node for _, _, node in frontier})
+            # Advance to the cheapest non-empty bucket; stop when all are empty
+            while current_cost < len(buckets) and not buckets[current_cost]:
+                current_cost += 1
+            if current_cost == len(buckets):
+                break
+                
+            # Save frontier state (nodes only, costs are not needed)
+            if capture:
+                record()
             
             # Get node with lowest cost
-            current_cost, _, current = heapq.heappop(frontier)
+            current = buckets[current_cost].popleft()
+            if capture:
+                remove(current)
             
             # Skip if already explored
-            if current in self.explored:
+            if explored[current]:
                 continue
             
             # Skip if we found a better path already
-            if current_cost > cost_map.get(current, float('inf')):
+            if current_cost > cost_map[current]:
                 continue
             
             # Mark as explored
-            self.explored.add(current)
+            explored[current] = 1
             
             # Check if target found
-            if current == self.grid.target:
+            if current == target:
                 result.path = self._reconstruct_path(current)
                 result.found = True
                 break
             
+            # Calculate new cost (uniform cost = 1 per edge)
+            new_cost = current_cost + 1
+            if new_cost == len(buckets):
+                buckets.append(deque())
+            append = buckets[new_cost].append
+                
             # Explore neighbors
-            neighbors = self.grid.get_neighbors(current)
-            for neighbor in neighbors:
-                # Calculate new cost (uniform cost = 1 per edge)
-                new_cost = current_cost + 1
+            for neighbor in flat[offsets[current]:offsets[current + 1]]:
+                if blocked[neighbor]:
+                    continue
                 
                 # Update if this is a better path
                 if neighbor not in cost_map or new_cost < cost_map[neighbor]:
                     cost_map[neighbor] = new_cost
-                    self.parent_map[neighbor] = current
-                    heapq.heappush(frontier, (new_cost, counter, neighbor))
-                    counter += 1
+                    parent_map[neighbor] = current
+                    append(neighbor)
+                    if capture:
+                        push(neighbor)
         
         # Store results
-        result.explored = self.explored.copy()
+        result.explored = self._explored_positions()
         result.frontier_history = self.frontier_history
-        result.total_nodes_explored = len(self.explored)
+        result.total_nodes_explored = len(result.explored)
         result.dynamic_obstacles_encountered = self.dynamic_obstacles_encountered
         
         return result
@@ -401,66 +752,100 @@ class DepthLimitedSearch(SearchAlgorithm):
     Best for: Avoiding infinite loops, limiting search depth
     """
     
-    def __init__(self, grid: Grid, depth_limit: int = 10):
+    def __init__(self, grid: Grid, depth_limit: int = 10, capture_frontier: bool = False):
         """
         Initialize DLS with a depth limit.
         
         Args:
             grid: Grid object to search on
             depth_limit: Maximum depth to explore
+            capture_frontier: Whether to log the frontier at every step for visualization
         """
-        super().__init__(grid)
+        super().__init__(grid, capture_frontier)
         self.depth_limit = depth_limit
+        self._check_obstacles = self._check_obstacles_dls
     
     def search(self) -> SearchResult:
         """Execute Depth-Limited Search."""
+        self.reset()
         result = SearchResult()
         
-        # Stack with depth tracking: (node, depth)
-        frontier = [(self.grid.start, 0)]
-        self.explored = set()
-        self.parent_map[self.grid.start] = None
+        # Static adjacency (CSR) and live blocked flags, indexed by node id
+        offsets, flat = self.grid.build_csr()
+        blocked = self.grid.occ
+        start = self.grid.encode(self.grid.start)
+        target = self.grid.encode(self.grid.target)
+        
+        # Stack with depth tracking, kept as parallel lists of node ids and depths
+        # so no (node, depth) tuple is allocated per push
+        frontier = [start]
+        depths = [0]
+        explored = self.explored = bytearray(len(blocked))
+        
+        # Frontier changes are only logged when capture_frontier is set
+        capture = self.capture_frontier
+        if capture:
+            self.frontier_history = FrontierLog([start], self.grid.decode)
+            record = self.frontier_history.record
+            push = self.frontier_history.push
+            remove = self.frontier_history.remove
         
         # Track nodes in frontier
-        in_frontier: Set[Tuple[int, int]] = {self.grid.start}
+        in_frontier = bytearray(len(blocked))
+        in_frontier[start] = 1
+        
+        # Bind attributes and methods used in the loop to locals
+        parent_map = self.parent_map
+        check_obstacles = self._check_obstacles
+        depth_limit = self.depth_limit
         
         while frontier:
-            # Check for dynamic obstacles
-            self._check_dynamic_obstacles(frontier)
+            # Check for dynamic obstacles; stop if they removed the last frontier node
+            check_obstacles(frontier, depths)
+            if not frontier:
+                break
             
-            # Save frontier state (extract nodes from tuples)
-            self.frontier_history.append({node for node, _ in frontier})
+            # Save frontier state (nodes only, depths are not needed)
+            if capture:
+                record()
             
             # Get next node with its depth
-            current, depth = frontier.pop()
-            in_frontier.discard(current)
+            current = frontier.pop()
+            depth = depths.pop()
+            in_frontier[current] = 0
+            if capture:
+                remove(current)
             
             # Skip if already explored
-            if current in self.explored:
+            if explored[current]:
                 continue
             
             # Mark as explored
-            self.explored.add(current)
+            explored[current] = 1
             
             # Check if target found
-            if current == self.grid.target:
+            if current == target:
                 result.path = self._reconstruct_path(current)
                 result.found = True
                 break
             
             # Only expand if within depth limit
-            if depth < self.depth_limit:
-                neighbors = self.grid.get_neighbors(current)
-                for neighbor in reversed(neighbors):
-                    if neighbor not in self.explored and neighbor not in in_frontier:
-                        self.parent_map[neighbor] = current
-                        frontier.append((neighbor, depth + 1))
-                        in_frontier.add(neighbor)
+            if depth < depth_limit:
+                for neighbor in reversed(flat[offsets[current]:offsets[current + 1]]):
+                    if blocked[neighbor]:
+                        continue
+                    if not explored[neighbor] and not in_frontier[neighbor]:
+                        parent_map[neighbor] = current
+                        frontier.append(neighbor)
+                        depths.append(depth + 1)
+                        in_frontier[neighbor] = 1
+                        if capture:
+                            push(neighbor)
         
         # Store results
-        result.explored = self.explored.copy()
+        result.explored = self._explored_positions()
         result.frontier_history = self.frontier_history
-        result.total_nodes_explored = len(self.explored)
+        result.total_nodes_explored = len(result.explored)
         result.dynamic_obstacles_encountered = self.dynamic_obstacles_encountered
         
         return result
@@ -470,100 +855,148 @@ class IterativeDeepeningDFS(SearchAlgorithm):
     """
     Iterative Deepening Depth-First Search (IDDFS)
     
-    Combines advantages of BFS and DFS:
-    - Memory efficient like DFS
+    Deepens the search one depth limit at a time:
     - Finds shortest path like BFS
-    Repeatedly performs DFS with increasing depth limits.
+    - Needs no depth limit up front, unlike DLS
+    
+    Instead of restarting from the start node for every depth limit, each
+    iteration resumes from the fringe left by the previous one (the nodes that
+    were cut off by the depth limit) and only searches one level deeper from
+    there. Explored nodes are kept across iterations, so no node is expanded
+    more than once. In effect this is a level-by-level (BFS-like) search: it
+    trades the classic IDDFS memory savings for never re-expanding a node.
     
-    Time Complexity: O(b^d) where b = branching factor, d = solution depth
-    Space Complexity: O(b * d)
-    Best for: Unknown solution depth, memory-constrained scenarios
+    Time Complexity: O(V) where V = number of cells (each expanded at most once)
+    Space Complexity: O(V) for the explored set, plus one whole depth level in the fringe
+    Best for: Unknown solution depth
     """
     
     def search(self) -> SearchResult:
         """Execute Iterative Deepening DFS."""
+        self.reset()
         result = SearchResult()
         
         # Maximum depth to try
         max_depth = max(self.grid.width, self.grid.height) * 2
         
-        # Accumulate explored nodes across all iterations
-        all_explored: Set[Tuple[int, int]] = set()
+        blocked = self.grid.occ
+        start = self.grid.encode(self.grid.start)
+        
+        # History holds the explored set at every step (only when capture_frontier is set)
+        if self.capture_frontier:
+            self.frontier_history = FrontierLog(decode=self.grid.decode)
         
-        # Try increasing depth limits
+        # Depth 0: the start node itself, which is also the first fringe
+        found, path = self._depth_limited_dfs(start, 0, [])
+        fringe = [start]
+        
+        # Try increasing depth limits, each one level deeper than the last
         for limit in range(1, max_depth + 1):
-            # Reset for each iteration
-            self.explored = set()
-            self.parent_map = {self.grid.start: None}
-            
-            # Perform DFS with current depth limit
-            found, path = self._dls_recursive(self.grid.start, limit, None)
-            
-            # Accumulate all explored nodes
-            all_explored.update(self.explored)
-            
-            # Stop if target found
-            if found:
-                result.path = path
-                result.found = True
-                result.explored = all_explored.copy()
+            if found or not fringe:
                 break
         
-        # If not found, still report all explored nodes
-        if not result.found:
-            result.explored = all_explored.copy()
-        
+            # Continue DFS from the previous fringe, collecting the next one
+            next_fringe: List[int] = []
+            for node in fringe:
+                # Nodes that turned into dynamic obstacles can no longer be expanded
+                if blocked[node]:
+                    continue
+                found, path = self._depth_limited_dfs(node, 1, next_fringe)
+                if found:
+                    break
+            fringe = next_fringe
+            
+        # Stop if target found
+        if found:
+            result.path = path
+            result.found = True
+            
+        # Report all explored nodes, whether or not the target was found
+        result.explored = self._explored_positions()
         result.frontier_history = self.frontier_history
-        result.total_nodes_explored = len(all_explored)
+        result.total_nodes_explored = len(self.explored)
         result.dynamic_obstacles_encountered = self.dynamic_obstacles_encountered
         
         return result
     
-    def _dls_recursive(self, current: Tuple[int, int], limit: int, 
-                      parent: Optional[Tuple[int, int]]) -> Tuple[bool, List[Tuple[int, int]]]:
+    def _depth_limited_dfs(self, root: int, limit: int,
+                           fringe: List[int]) -> Tuple[bool, List[Tuple[int, int]]]:
         """
-        Recursive DFS with depth limit.
+        DFS with depth limit, using an explicit stack instead of recursion.
+        
+        Each stack entry holds a node, its remaining depth and an iterator over
+        its neighbors, so nodes are visited in exactly the order a recursive DFS
+        would visit them, without Python call overhead or the recursion limit.
         
         Args:
-            current: Current node being explored
-            limit: Remaining depth allowed
-            parent: Parent node (for reference)
+            root: Node id to start from (explored here if not already)
+            limit: Maximum depth allowed below the root
+            fringe: List collecting the nodes reached exactly at the depth limit
             
         Returns:
             (found, path) - found is True if target reached, path is the solution path
         """
-        # Periodically check for dynamic obstacles
-        if len(self.explored) % 10 == 0:
-            self._check_dynamic_obstacles([])
-        
-        # Mark current node as explored
-        self.explored.add(current)
-        self.frontier_history.append(self.explored.copy())
-        
-        # Check if target reached
-        if current == self.grid.target:
-            return True, self._reconstruct_path(current)
-        
-        # Stop if depth limit reached
-        if limit == 0:
-            return False, []
-        
-        # Recursively explore neighbors with reduced depth
-        neighbors = self.grid.get_neighbors(current)
-        for neighbor in neighbors:
-            # Skip already explored nodes in this iteration
-            if neighbor not in self.explored:
-                # Set parent relationship
-                self.parent_map[neighbor] = current
+        # Static adjacency (CSR) and live blocked flags, indexed by node id
+        offsets, flat = self.grid.build_csr()
+        blocked = self.grid.occ
+        target = self.grid.encode(self.grid.target)
+        
+        # Bind attributes and methods used in the loop to locals
+        explored = self.explored
+        explored_add = explored.add
+        parent_map = self.parent_map
+        capture = self.capture_frontier
+        if capture:
+            push = self.frontier_history.push
+            record = self.frontier_history.record
+        
+        stack: List[Tuple[int, int, Iterator[int]]] = []
+        node, remaining = root, limit
+        
+        while True:
+            # Fringe roots were marked as explored by a previous iteration
+            if node not in explored:
+                # Periodically check for dynamic obstacles
+                if len(explored) % 10 == 0:
+                    self._spawn_obstacle()
+        
+                # Mark node as explored
+                explored_add(node)
+                if capture:
+                    push(node)
+                    record()
+        
+                # Check if target reached
+                if node == target:
+                    return True, self._reconstruct_path(node)
                 
-                # Recursive call with decreased limit
-                found, path = self._dls_recursive(neighbor, limit - 1, current)
+            # Only descend if depth limit not reached; neighbors blocked by now are skipped
+            if remaining > 0:
+                neighbors = [neighbor for neighbor in flat[offsets[node]:offsets[node + 1]]
+                             if not blocked[neighbor]]
+                stack.append((node, remaining, iter(neighbors)))
+            else:
+                # Cut off by the depth limit: the next iteration resumes from here
+                fringe.append(node)
                 
-                if found:
-                    return True, path
+            # Find the next unexplored neighbor of the deepest node, backtracking as needed
+            while stack:
+                parent, parent_remaining, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    # Skip already explored nodes
+                    if neighbor not in explored:
+                        break
+                else:
+                    stack.pop()
+                    continue
         
-        # No solution found from this node
-        return False, []
+                # Set parent relationship and descend with decreased limit
+                parent_map[neighbor] = parent
+                node, remaining = neighbor, parent_remaining - 1
+                break
+            else:
+                # No solution found within the depth limit
+                return False, []
 
 
 class BidirectionalSearch(SearchAlgorithm):
@@ -578,119 +1011,216 @@ class BidirectionalSearch(SearchAlgorithm):
     Best for: Dense graphs, when both start and target are known
     """
     
+    def __init__(self, grid: Grid, capture_frontier: bool = False):
+        """
+        Initialize Bidirectional search.
+        
+        Args:
+            grid: Grid object to search on
+            capture_frontier: Whether to log the frontier at every step for visualization
+        """
+        super().__init__(grid, capture_frontier)
+        self._check_obstacles = self._check_obstacles_deque
+        
+        # Parent array of the backward search; the forward one is parent_map
+        self._backward_parent: List[int] = []
+    
+    def reset(self) -> None:
+        """Clear the previous search, reusing both parent arrays."""
+        super().reset()
+        self._backward_parent = self._cleared_parents(self._backward_parent)
+    
     def search(self) -> SearchResult:
         """Execute Bidirectional Search."""
+        self.reset()
         result = SearchResult()
         
+        # Static adjacency (CSR) and live blocked flags, indexed by node id
+        offsets, flat = self.grid.build_csr()
+        blocked = self.grid.occ
+        start = self.grid.encode(self.grid.start)
+        target = self.grid.encode(self.grid.target)
+        
         # Two separate frontiers
-        forward_frontier = deque([self.grid.start])
-        backward_frontier = deque([self.grid.target])
+        forward_frontier = deque([start])
+        backward_frontier = deque([target])
+        
+        # Explored and in-frontier flags of both searches, packed into one status byte per node
+        status = bytearray(len(blocked))
+        status[start] |= FWD_FRONT
+        status[target] |= BWD_FRONT
         
-        # Separate explored sets
-        forward_explored: Set[Tuple[int, int]] = set()
-        backward_explored: Set[Tuple[int, int]] = set()
+        # Separate parent arrays (-1 = no parent) for path reconstruction, both
+        # cleared and reused by reset()
+        forward_parent = self.parent_map
+        backward_parent = self._backward_parent
         
-        # Track nodes in frontiers
-        forward_in_frontier: Set[Tuple[int, int]] = {self.grid.start}
-        backward_in_frontier: Set[Tuple[int, int]] = {self.grid.target}
+        meeting_point: Optional[int] = None
         
-        # Separate parent maps for path reconstruction
-        forward_parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {self.grid.start: None}
-        backward_parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {self.grid.target: None}
+        # Both frontiers are logged together as one combined frontier, and only
+        # when capture_frontier is set
+        capture = self.capture_frontier
+        if capture:
+            self.frontier_history = FrontierLog([start, target], self.grid.decode)
+            record = self.frontier_history.record
+            push = self.frontier_history.push
+            remove = self.frontier_history.remove
         
-        meeting_point: Optional[Tuple[int, int]] = None
+        # Bind attributes and methods used in the loop to locals
+        check_obstacles = self._check_obstacles
         
         # Alternate between forward and backward search
         while forward_frontier or backward_frontier:
-            # Check for dynamic obstacles in both frontiers
-            self._check_dynamic_obstacles(forward_frontier)
-            self._check_dynamic_obstacles(backward_frontier)
+            # Check for dynamic obstacles in both frontiers. The original loop rolled
+            # once per frontier, so keep two spawn chances per iteration; each roll
+            # now checks both frontiers, since an obstacle can sit in either one
+            for _ in range(2):
+                check_obstacles(forward_frontier, backward_frontier)
             
             # === Forward search step ===
             if forward_frontier:
                 current = forward_frontier.popleft()
-                forward_in_frontier.discard(current)
+                status[current] &= ~FWD_FRONT
+                if capture:
+                    remove(current)
                 
                 # Skip if already explored
-                if current not in forward_explored:
-                    forward_explored.add(current)
-                    self.explored.add(current)
+                if not status[current] & FWD_EXPLORED:
+                    status[current] |= FWD_EXPLORED
                     
                     # Explore neighbors
-                    neighbors = self.grid.get_neighbors(current)
-                    for neighbor in neighbors:
+                    for neighbor in flat[offsets[current]:offsets[current + 1]]:
+                        if blocked[neighbor]:
+                            continue
                         # Check for meeting point
-                        if neighbor in backward_explored:
+                        if status[neighbor] & BWD_EXPLORED:
                             meeting_point = neighbor
                             forward_parent[neighbor] = current
                             break
                         
                         # Add to frontier if not explored
-                        if neighbor not in forward_explored and neighbor not in forward_in_frontier:
+                        if not status[neighbor] & (FWD_EXPLORED | FWD_FRONT):
                             forward_parent[neighbor] = current
                             forward_frontier.append(neighbor)
-                            forward_in_frontier.add(neighbor)
+                            status[neighbor] |= FWD_FRONT
+                            if capture:
+                                push(neighbor)
                     
-                    if meeting_point:
+                    if meeting_point is not None:
                         break
             
             # === Backward search step ===
-            if backward_frontier and not meeting_point:
+            if backward_frontier and meeting_point is None:
                 current = backward_frontier.popleft()
-                backward_in_frontier.discard(current)
+                status[current] &= ~BWD_FRONT
+                if capture:
+                    remove(current)
                 
                 # Skip if already explored
-                if current not in backward_explored:
-                    backward_explored.add(current)
-                    self.explored.add(current)
+                if not status[current] & BWD_EXPLORED:
+                    status[current] |= BWD_EXPLORED
                     
                     # Explore neighbors
-                    neighbors = self.grid.get_neighbors(current)
-                    for neighbor in neighbors:
+                    for neighbor in flat[offsets[current]:offsets[current + 1]]:
+                        if blocked[neighbor]:
+                            continue
                         # Check for meeting point
-                        if neighbor in forward_explored:
+                        if status[neighbor] & FWD_EXPLORED:
                             meeting_point = neighbor
                             backward_parent[neighbor] = current
                             break
                         
                         # Add to frontier if not explored
-                        if neighbor not in backward_explored and neighbor not in backward_in_frontier:
+                        if not status[neighbor] & (BWD_EXPLORED | BWD_FRONT):
                             backward_parent[neighbor] = current
                             backward_frontier.append(neighbor)
-                            backward_in_frontier.add(neighbor)
+                            status[neighbor] |= BWD_FRONT
+                            if capture:
+                                push(neighbor)
                     
-                    if meeting_point:
+                    if meeting_point is not None:
                         break
             
             # Save combined frontier state for visualization
-            combined_frontier = set(forward_frontier) | set(backward_frontier)
-            self.frontier_history.append(combined_frontier)
+            if capture:
+                record()
         
         # Reconstruct complete path if meeting point found
-        if meeting_point:
+        if meeting_point is not None:
+            decode = self.grid.decode
+            
             # Path from start to meeting point
             path_forward = []
-            pos = meeting_point
-            while pos is not None:
-                path_forward.append(pos)
-                pos = forward_parent.get(pos)
+            node = meeting_point
+            while node != -1:
+                path_forward.append(decode(node))
+                node = forward_parent[node]
             path_forward.reverse()
             
             # Path from meeting point to target
             path_backward = []
-            pos = backward_parent.get(meeting_point)
-            while pos is not None:
-                path_backward.append(pos)
-                pos = backward_parent.get(pos)
+            node = backward_parent[meeting_point]
+            while node != -1:
+                path_backward.append(decode(node))
+                node = backward_parent[node]
             
             # Combine paths (meeting point already in forward path)
             result.path = path_forward + path_backward
             result.found = True
         
-        # Store results
-        result.explored = self.explored.copy()
+        # Store results (a node counts as explored if either search explored it)
+        self.explored = status.translate(_EXPLORED_TABLE)
+        result.explored = self._explored_positions()
         result.frontier_history = self.frontier_history
-        result.total_nodes_explored = len(self.explored)
+        result.total_nodes_explored = len(result.explored)
         result.dynamic_obstacles_encountered = self.dynamic_obstacles_encountered
         
-        return result
\ No newline at end of file
+        return result
+
+
+def _run_search(grid: Grid, algorithm: Callable[[Grid], SearchAlgorithm]) -> SearchResult:
+    """
+    Run one search on a fresh copy of a grid (worker side of run_batch).
+    
+    Args:
+        grid: Grid to search; the worker process owns its own copy
+        algorithm: Callable building the search, e.g. an algorithm class
+        
+    Returns:
+        SearchResult: Result of the search
+    """
+    # Start every run without leftover dynamic obstacles, as the app does
+    grid.clear_dynamic_obstacles()
+    return algorithm(grid).search()
+
+
+def run_batch(grids: Sequence[Grid], algorithms: Sequence[Callable[[Grid], SearchAlgorithm]],
+              max_workers: Optional[int] = None) -> List[SearchResult]:
+    """
+    Run every algorithm on every grid in parallel worker processes.
+    
+    Runs are independent (each worker gets its own copy of the grid), so
+    batch comparisons scale with the number of cores. Processes are used
+    rather than threads because the searches are pure Python and would
+    serialize on the GIL.
+    
+    Dynamic obstacle spawning draws from each worker's own random state, so
+    results with a non-zero spawn probability can differ from a sequential run.
+    
+    Args:
+        grids: Grids to search; they are not modified
+        algorithms: Algorithm classes, or any picklable callable taking a Grid and
+            returning a SearchAlgorithm (e.g. functools.partial(DepthLimitedSearch,
+            depth_limit=30))
+        max_workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        List[SearchResult]: Results grid by grid, in the order of algorithms for each grid
+    """
+    jobs = [(grid, algorithm) for grid in grids for algorithm in algorithms]
+    if not jobs:
+        return []
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_search, grid, algorithm) for grid, algorithm in jobs]
+        return [future.result() for future in futures]
\ No newline at end of file
@@ -5,12 +5,25 @@ This module handles the grid representation, obstacle management, and dynamic ob
 It provides the foundation for all search algorithms to work on.
 """
 
+import math
 import random
-from typing import List, Tuple, Set
-from dataclasses import dataclass
+from typing import FrozenSet, List, Tuple, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Occupancy bits stored per cell in Grid.occ
+WALL_BIT = 1                        # Static wall
+DYN_BIT = 2                         # Dynamic obstacle
+BLOCKED_BITS = WALL_BIT | DYN_BIT   # Any bit set means the cell cannot be entered
+
+# bytes.translate table mapping an occupancy byte to 1 if the cell is free, else 0
+_FREE_TABLE = bytes([1] + [0] * 255)
+
+# Neighbor displacements (dx, dy) in the required expansion order
+_OFFSETS = ((0, -1), (1, 0), (0, 1), (1, 1), (-1, 0), (-1, -1), (1, -1), (-1, 1))
+
+
 class CellType(Enum):
     """
     Enumeration for different cell types in the grid.
@@ -27,30 +40,19 @@ class CellType(Enum):
     PATH = 6        # Cell that is part of the final solution path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Cell:
     """
     Represents a single cell in the grid.
     
     Using @dataclass decorator for clean, minimal boilerplate.
-    Provides automatic __init__, __repr__, and __eq__ methods.
+    Provides automatic __init__, __repr__, __eq__ and __hash__ methods.
+    Cells are immutable and use __slots__, so they carry no per-instance __dict__.
+    Cells are equal (and hash the same) if their coordinates match, regardless of cell_type.
     """
     x: int                                    # X-coordinate (column) of the cell
     y: int                                    # Y-coordinate (row) of the cell
-    cell_type: CellType = CellType.EMPTY      # Type of cell (empty, wall, start, etc.)
-    
-    def __hash__(self):
-        """Make cell hashable so it can be added to sets and used in dictionaries."""
-        return hash((self.x, self.y))
-    
-    def __eq__(self, other):
-        """
-        Compare two cells for equality.
-        Cells are equal if their coordinates match, regardless of cell_type.
-        """
-        if not isinstance(other, Cell):
-            return False
-        return self.x == other.x and self.y == other.y
+    cell_type: CellType = field(default=CellType.EMPTY, compare=False)  # Type of cell (empty, wall, start, etc.)
 
 
 class Grid:
@@ -68,9 +70,12 @@ class Grid:
         height (int): Grid height in cells
         start (Tuple[int, int]): Starting position (x, y)
         target (Tuple[int, int]): Target position (x, y)
-        walls (Set[Tuple[int, int]]): Set of static wall positions
-        dynamic_obstacles (Set[Tuple[int, int]]): Dynamic obstacles appearing during search
-        dynamic_spawn_probability (float): Probability (0-1) of obstacle spawn per step
+        walls (FrozenSet[Tuple[int, int]]): Static wall positions (read-only view of occ)
+        dynamic_obstacles (FrozenSet[Tuple[int, int]]): Dynamic obstacles appearing during
+            search (read-only view of occ)
+        dynamic_spawn_probability (float): Probability (0-1) of obstacle spawn per step;
+            may be changed between calls, the next spawn check picks up the new value
+        occ (bytearray): Per-cell occupancy bits (WALL_BIT, DYN_BIT) indexed by node id
     """
     
     def __init__(self, width: int, height: int, start: Tuple[int, int], 
@@ -94,11 +99,32 @@ class Grid:
         self.start = start
         self.target = target
         
-        # Initialize obstacle collections
-        self.walls: Set[Tuple[int, int]] = set()                    # Static permanent walls
-        self.dynamic_obstacles: Set[Tuple[int, int]] = set()        # Temporary dynamic obstacles
+        # Dynamic obstacle configuration
         self.dynamic_spawn_probability = dynamic_spawn_probability  # Spawn chance per iteration
         
+        # Spawn checks left until the next obstacle appears, drawn on the first check
+        # and redrawn whenever dynamic_spawn_probability is changed
+        self._spawn_countdown: Optional[float] = None
+        self._spawn_gap_probability: Optional[float] = None
+        
+        # Occupancy bitmap indexed by node id (y * width + x); the only store of walls
+        # and dynamic obstacles. A non-zero byte means the cell is blocked, so search
+        # loops can test a cell with one index.
+        self.occ = bytearray(width * height)
+        
+        # Node ids of the current dynamic obstacles, in spawn order (few at a time)
+        self._dynamic_nodes: List[int] = []
+        
+        # Position sets for walls/dynamic_obstacles, rebuilt on demand after changes
+        self._walls_view: Optional[FrozenSet[Tuple[int, int]]] = None
+        self._dynamic_view: Optional[FrozenSet[Tuple[int, int]]] = None
+        
+        # Static neighbor adjacency in CSR layout, built lazily by build_csr()
+        self._csr: Optional[Tuple[List[int], List[int]]] = None
+        
+        # Per-cell static neighbor positions, built lazily by build_neighbor_cache()
+        self._static_neighbors: Optional[List[Tuple[Tuple[int, int], ...]]] = None
+        
         # Validate that start and target are within grid bounds
         if not self._is_valid_position(start):
             raise ValueError(f"Start position {start} is out of grid bounds ({width}×{height})")
@@ -119,6 +145,68 @@ class Grid:
         # Check both x and y are within valid range [0, width) and [0, height)
         return 0 <= x < self.width and 0 <= y < self.height
     
+    def encode(self, pos: Tuple[int, int]) -> int:
+        """
+        Convert a position to its integer node id.
+        
+        Node ids are row-major (y * width + x) and index occ and the
+        arrays returned by build_csr(). On a grid every neighbor of node i is
+        already within width + 1 ids of i, so a Morton or Cuthill-McKee
+        renumbering would add a permutation lookup to every encode/decode
+        without bringing flag reads noticeably closer together.
+        
+        Args:
+            pos (Tuple[int, int]): Position as (x, y)
+            
+        Returns:
+            int: Node id of the position
+        """
+        x, y = pos
+        return y * self.width + x
+    
+    def decode(self, node_id: int) -> Tuple[int, int]:
+        """
+        Convert an integer node id back to its position.
+        
+        Args:
+            node_id (int): Node id as returned by encode()
+            
+        Returns:
+            Tuple[int, int]: Position as (x, y)
+        """
+        y, x = divmod(node_id, self.width)
+        return (x, y)
+    
+    @property
+    def walls(self) -> FrozenSet[Tuple[int, int]]:
+        """
+        Static wall positions, derived from occ.
+        
+        The set is built on first access and reused until walls change, so
+        callers that only search the grid never pay for it.
+        
+        Returns:
+            FrozenSet[Tuple[int, int]]: Positions (x, y) of all static walls
+        """
+        if self._walls_view is None:
+            decode = self.decode
+            occ = self.occ
+            self._walls_view = frozenset(decode(node) for node in range(len(occ))
+                                         if occ[node] & WALL_BIT)
+        return self._walls_view
+    
+    @property
+    def dynamic_obstacles(self) -> FrozenSet[Tuple[int, int]]:
+        """
+        Current dynamic obstacle positions, derived from occ.
+        
+        Returns:
+            FrozenSet[Tuple[int, int]]: Positions (x, y) of all dynamic obstacles
+        """
+        if self._dynamic_view is None:
+            self._dynamic_view = frozenset(map(self.decode, self._dynamic_nodes))
+        return self._dynamic_view
+    
     def add_wall(self, x: int, y: int) -> None:
         """
         Add a static wall at the given position.
@@ -132,36 +220,66 @@ class Grid:
         pos = (x, y)
         # Only add wall if position is valid and not start/target
         if self._is_valid_position(pos) and pos != self.start and pos != self.target:
-            self.walls.add(pos)
+            self.occ[y * self.width + x] |= WALL_BIT
+            self._walls_view = None
+            self._csr = None  # Static adjacency changed
+            self._static_neighbors = None
     
     def add_walls_randomly(self, count: int) -> None:
         """
         Add random static walls to the grid.
         
-        Uses random placement with a maximum attempt limit to prevent
-        infinite loops if grid is too saturated with walls.
+        Draws all wall cells at once from the free cells (not wall, not start,
+        not target) without replacement, so there is no rejection loop and no
+        retries as the grid fills up. If fewer free cells than count remain,
+        all of them become walls.
         
         Args:
             count (int): Number of random walls to add
         """
-        # Calculate max attempts to prevent infinite loop (10x the target count)
-        max_attempts = count * 10
-        added = 0
-        attempts = 0
-        
-        # Keep trying to add walls until we reach target count or max attempts
-        while added < count and attempts < max_attempts:
-            # Generate random coordinates
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            pos = (x, y)
-            
-            # Check if position is available (not wall, not start, not target)
-            if pos not in self.walls and pos != self.start and pos != self.target:
-                self.add_wall(x, y)
-                added += 1
-            
-            attempts += 1
+        occ = self.occ
+        start = self.encode(self.start)
+        target = self.encode(self.target)
+        
+        # Collect the cells that can still take a wall
+        free = [node for node in range(len(occ))
+                if not occ[node] & WALL_BIT and node != start and node != target]
+                
+        # Sample the new walls in one draw and mark them
+        for node in random.sample(free, min(count, len(free))):
+            occ[node] |= WALL_BIT
+        self._walls_view = None
+        self._csr = None  # Static adjacency changed
+        self._static_neighbors = None
+    
+    def _draw_spawn_gap(self) -> float:
+        """
+        Draw how many spawn checks it takes until the next obstacle appears.
+        
+        Each check succeeds independently with dynamic_spawn_probability, so
+        the gap follows a geometric distribution and can be sampled directly
+        by inverting its CDF. Because the distribution is memoryless, a fresh
+        gap can be drawn at any time (e.g. after the probability changes).
+        
+        Returns:
+            float: Number of checks (at least 1), or infinity if spawning is disabled
+        """
+        p = self.dynamic_spawn_probability
+        if p <= 0.0:
+            return math.inf
+        if p >= 1.0:
+            return 1
+        
+        # log1p keeps tiny probabilities from rounding 1 - p to exactly 1.0;
+        # a zero denominator or an overflowing gap means it never spawns in practice
+        denominator = math.log1p(-p)
+        if denominator == 0.0:
+            return math.inf
+        # 1 - random() lies in (0, 1], so the logarithm is always defined
+        gap = math.log(1.0 - random.random()) / denominator
+        if not math.isfinite(gap):
+            return math.inf
+        return int(gap) + 1
     
     def spawn_dynamic_obstacle(self) -> Tuple[int, int] | None:
         """
@@ -169,34 +287,54 @@ class Grid:
         
         Probability-based spawning mechanism. If spawn occurs, obstacle
         appears at random empty location (not wall, start, or target).
+        Rather than rolling per call, the number of calls until the next
+        spawn is drawn up front (see _draw_spawn_gap) and counted down.
         
         Returns:
             Tuple[int, int] | None: Position of new obstacle or None if none spawned
         """
-        # Check if dynamic obstacle should spawn based on probability
-        if random.random() > self.dynamic_spawn_probability:
+        # Count down to the next spawn instead of drawing a random number per call
+        if (self._spawn_countdown is None
+                or self._spawn_gap_probability != self.dynamic_spawn_probability):
+            self._spawn_gap_probability = self.dynamic_spawn_probability
+            self._spawn_countdown = self._draw_spawn_gap()
+        self._spawn_countdown -= 1
+        if self._spawn_countdown > 0:
             return None
+        self._spawn_countdown = self._draw_spawn_gap()
         
-        # Collect all empty cells available for obstacle placement
-        empty_cells = []
-        for x in range(self.width):
-            for y in range(self.height):
-                pos = (x, y)
-                # Cell is empty if: not wall, not dynamic obstacle, not start, not target
-                if (pos not in self.walls and 
-                    pos not in self.dynamic_obstacles and 
-                    pos != self.start and 
-                    pos != self.target):
-                    empty_cells.append(pos)
-        
-        # Place obstacle at random empty location if available
-        if empty_cells:
-            new_obstacle = random.choice(empty_cells)
-            self.dynamic_obstacles.add(new_obstacle)
-            return new_obstacle
+        # Mark the cells available for obstacle placement in one C-level pass
+        # Cell is empty if: no occupancy bit set, not start, not target
+        width = self.width
+        free = self.occ.translate(_FREE_TABLE)
+        free[self.encode(self.start)] = 0
+        free[self.encode(self.target)] = 0
         
         # No empty space available
-        return None
+        empty_count = free.count(1)
+        if not empty_count:
+            return None
+        
+        # Pick the k-th empty cell in column-by-column order; choosing from a range
+        # makes the same random draw as choosing from the full list of empty cells
+        k = random.choice(range(empty_count))
+        for x in range(width):
+            column = free[x::width]
+            in_column = column.count(1)
+            if k < in_column:
+                break
+            k -= in_column
+        
+        y = -1
+        for _ in range(k + 1):
+            y = column.index(1, y + 1)
+        
+        # Place obstacle at the chosen empty location
+        node = y * width + x
+        self.occ[node] |= DYN_BIT
+        self._dynamic_nodes.append(node)
+        self._dynamic_view = None
+        return (x, y)
     
     def is_blocked(self, pos: Tuple[int, int]) -> bool:
         """
@@ -215,10 +353,10 @@ class Grid:
         """
         x, y = pos
         # First check if position is within valid grid bounds
-        if not self._is_valid_position(pos):
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return True  # Out of bounds is always blocked
         # Check for static walls or dynamic obstacles
-        return pos in self.walls or pos in self.dynamic_obstacles
+        return (self.occ[y * self.width + x] & BLOCKED_BITS) != 0
     
     def clear_dynamic_obstacles(self) -> None:
         """
@@ -227,7 +365,11 @@ class Grid:
         Useful for resetting search state or preparing for a new algorithm run.
         Static walls are preserved and not cleared.
         """
-        self.dynamic_obstacles.clear()
+        occ = self.occ
+        for node in self._dynamic_nodes:
+            occ[node] &= ~DYN_BIT
+        self._dynamic_nodes.clear()
+        self._dynamic_view = None
     
     def get_neighbors(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
@@ -250,35 +392,133 @@ class Grid:
             List[Tuple[int, int]]: List of valid unblocked neighbor positions in specified order
         """
         x, y = pos
+        width, height, occ = self.width, self.height, self.occ
         
-        # Define all possible movements in the required order
-        # Each movement is defined as a displacement vector
-        movements = [
-            (x, y - 1),        # 1. Up
-            (x + 1, y),        # 2. Right
-            (x, y + 1),        # 3. Down
-            (x + 1, y + 1),    # 4. BottomRight Diagonal
-            (x - 1, y),        # 5. Left
-            (x - 1, y - 1),    # 6. TopLeft Diagonal
-            (x + 1, y - 1),    # 7. TopRight Diagonal
-            (x - 1, y + 1),    # 8. BottomLeft Diagonal
-        ]
-        
-        # Filter out invalid positions and blocked cells
+        if 0 <= x < width and 0 <= y < height:
+            # Walls and bounds are already filtered in the cache; only dynamic
+            # obstacles can change between calls
+            cached = self.build_neighbor_cache()[y * width + x]
+            if not self._dynamic_nodes:
+                return list(cached)
+            return [p for p in cached if not occ[p[1] * width + p[0]] & DYN_BIT]
+            
+        # Positions outside the grid are not cached: filter out invalid positions and
+        # blocked cells, with the bounds and occupancy tests inlined
         neighbors = []
-        for neighbor_pos in movements:
+        for dx, dy in _OFFSETS:
+            nx, ny = x + dx, y + dy
             # Only add if within bounds AND not blocked by obstacle
-            if (self._is_valid_position(neighbor_pos) and 
-                not self.is_blocked(neighbor_pos)):
-                neighbors.append(neighbor_pos)
+            if 0 <= nx < width and 0 <= ny < height and not occ[ny * width + nx] & BLOCKED_BITS:
+                neighbors.append((nx, ny))
         
         return neighbors
     
+    def get_neighbor_indices(self, node_id: int) -> List[int]:
+        """
+        Get valid neighbor node ids in strict movement order.
+        
+        Integer counterpart of get_neighbors(): same order and the same
+        blocking rules, but nodes are passed and returned as ids (see encode()),
+        so no tuples are created. Prefer this in hot loops that track nodes by id.
+        Like get_neighbors(), a wall cell still reports its open neighbors.
+        
+        Args:
+            node_id (int): Node id of a cell inside the grid, in [0, width * height)
+        
+        Returns:
+            List[int]: Ids of valid unblocked neighbors in specified order
+        
+        Raises:
+            ValueError: If node_id does not belong to a cell of the grid
+        """
+        occ = self.occ
+        if not 0 <= node_id < len(occ):
+            raise ValueError(f"Node id {node_id} is out of grid bounds (0 to {len(occ) - 1})")
+        
+        if occ[node_id] & WALL_BIT:
+            # Walls have no CSR entry (they are never expanded); use the position cache
+            neighbors = [self.encode(p) for p in self.build_neighbor_cache()[node_id]]
+        else:
+            offsets, flat = self.build_csr()
+            neighbors = flat[offsets[node_id]:offsets[node_id + 1]]
+        if not self._dynamic_nodes:
+            return neighbors
+        return [n for n in neighbors if not occ[n] & DYN_BIT]
+    
+    def build_neighbor_cache(self) -> List[Tuple[Tuple[int, int], ...]]:
+        """
+        Precompute the in-bounds, non-wall neighbors of every cell.
+        
+        Entry y * width + x holds the neighbor positions of (x, y) in the same
+        movement order as get_neighbors(). Unlike build_csr(), wall cells get
+        their open neighbors too, since get_neighbors() may be asked about them.
+        
+        The cache is rebuilt only after walls change.
+        
+        Returns:
+            List[Tuple[Tuple[int, int], ...]]: Neighbor positions per node id
+        """
+        if self._static_neighbors is None:
+            width, height = self.width, self.height
+            occ = self.occ
+            
+            cache = []
+            for y in range(height):
+                for x in range(width):
+                    cache.append(tuple(
+                        (x + dx, y + dy) for dx, dy in _OFFSETS
+                        if 0 <= x + dx < width and 0 <= y + dy < height
+                        and not occ[(y + dy) * width + x + dx] & WALL_BIT
+                    ))
+                    
+            self._static_neighbors = cache
+            
+        return self._static_neighbors
+    
+    def build_csr(self) -> Tuple[List[int], List[int]]:
+        """
+        Precompute the static neighbor adjacency of every cell in CSR layout.
+        
+        The neighbors of node id i are flat[offsets[i]:offsets[i + 1]], listed in
+        the same movement order as get_neighbors(). Only static walls and grid
+        bounds are taken into account: dynamic obstacles change during a search,
+        so callers filter them out with occ.
+        
+        The arrays are cached and rebuilt only after walls change. Search loops
+        read neighbor ids straight from them, so expanding a node costs one slice
+        plus one occ lookup per neighbor, with no bounds or offset arithmetic.
+        
+        Returns:
+            Tuple[List[int], List[int]]: (offsets, flat) adjacency arrays
+        """
+        if self._csr is None:
+            width, height = self.width, self.height
+            occ = self.occ
+            
+            offsets = [0]
+            flat: List[int] = []
+            for y in range(height):
+                for x in range(width):
+                    # Walls are never expanded, so they get no neighbors
+                    if not occ[y * width + x] & WALL_BIT:
+                        for dx, dy in _OFFSETS:
+                            nx, ny = x + dx, y + dy
+                            if 0 <= nx < width and 0 <= ny < height and not occ[ny * width + nx] & WALL_BIT:
+                                flat.append(ny * width + nx)
+                    offsets.append(len(flat))
+                    
+            self._csr = (offsets, flat)
+            
+        return self._csr
+    
     def get_heuristic_distance(self, pos: Tuple[int, int]) -> float:
         """
-        Calculate Manhattan distance heuristic to target.
+        Calculate Chebyshev distance heuristic to target.
         
-        Manhattan distance = |x1 - x2| + |y1 - y2|
+        Chebyshev distance = max(|x1 - x2|, |y1 - y2|)
+        Diagonal moves cost the same as straight ones on this 8-connected grid, so
+        this is the exact move count on an empty grid: admissible and as tight as
+        possible, whereas Manhattan distance overestimates diagonal routes.
         This is useful for informed search algorithms (not required for this assignment,
         but included for future enhancements like A* search).
         
@@ -286,9 +526,9 @@ class Grid:
             pos (Tuple[int, int]): Current position (x, y)
         
         Returns:
-            float: Manhattan distance from pos to target
+            float: Chebyshev distance from pos to target
         """
         x, y = pos
         tx, ty = self.target
-        # Calculate Manhattan distance: sum of absolute differences
-        return abs(x - tx) + abs(y - ty)
+        # Calculate Chebyshev distance: largest absolute difference
+        return max(abs(x - tx), abs(y - ty))
@@ -10,7 +10,6 @@ import pygame
 from typing import List, Set, Tuple, Optional
 from grid import Grid
 from algorithms import SearchResult
-import time
 
 
 class Colors:
@@ -35,6 +34,9 @@ class Colors:
     # UI colors
     TEXT_COLOR = (0, 0, 0)           # Black text
     UI_BACKGROUND = (230, 230, 230)  # Light gray background
+    
+    # Internal colors
+    TRANSPARENT = (255, 0, 255)      # Color key for the state overlay (never drawn)
 
 
 class GridVisualizer:
@@ -62,6 +64,9 @@ class GridVisualizer:
         """
         self.grid = grid
         self.animation_delay = animation_delay
+        # Frame rate cap for Clock.tick (0 means no limit); kept as a float so
+        # delays of a second or more still slow the animation down
+        self.fps = 1.0 / animation_delay if animation_delay > 0 else 0
         self.show_dynamic_obstacles = show_dynamic_obstacles
         
         # Calculate optimal cell size based on window dimensions
@@ -80,31 +85,164 @@ class GridVisualizer:
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption("GOOD PERFORMANCE TIME APP - Uninformed Search Visualization")
         
-        # Setup fonts for different text sizes
+        # Frame pacing clock and fonts for different text sizes
         self.clock = pygame.time.Clock()
         self.font_large = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
         self.font_title = pygame.font.Font(None, 28)
+        
+        # Scratch rectangles reused by draw_cell, _update_cell and the progress bar
+        self._cell_rect = pygame.Rect(0, 0, self.cell_size - 2, self.cell_size - 2)
+        self._dirty_rect = pygame.Rect(0, 0, self.cell_size, self.cell_size)
+        self._bar_rect = pygame.Rect(0, 0, 300, 20)
+        self._bar_fill_rect = pygame.Rect(0, 0, 0, 20)
+        
+        # Static layers (grid lines, walls, start, target) rendered once
+        self._background = pygame.Surface((self.window_width, self.window_height))
+        self._build_background()
+        
+        # Explored/path cells accumulate here so each frame blits them at once
+        self._overlay = pygame.Surface((self.grid_width, self.grid_height))
+        self._overlay.set_colorkey(Colors.TRANSPARENT)
+        self._overlay.fill(Colors.TRANSPARENT)
+        
+        # Cells the overlay never covers (drawn in the background instead)
+        self._endpoints = frozenset((grid.start, grid.target))
+        
+        # Screen area redrawn whenever the progress text changes
+        self._panel_rect = pygame.Rect(self.grid_width, 0, ui_width, self.window_height)
+        
+        # Top of the legend, which sits at the bottom of the panel
+        self._legend_y = self.window_height - 200
+        
+        # Panel chrome rendered once, with the positions it leaves for the per-run
+        # text; that text and the legend are cached on first draw
+        self._panel_chrome, self._algo_name_y, self._results_y = self._render_static_panel()
+        self._result_panel: Optional[pygame.Surface] = None
+        self._result_panel_key: Optional[Tuple[str, Optional[SearchResult]]] = None
+        self._progress_y = 0
+        self._legend_on_top = False
+    
+    def _build_background(self) -> None:
+        """
+        Render the parts of the scene that never change during an animation.
+        
+        Grid lines, walls, start and target are drawn once onto
+        ``self._background``; each frame then starts with a single blit of
+        this surface instead of redrawing every line and wall.
+        """
+        self.draw_grid(self._background)
+        for wall_pos in self.grid.walls:
+            self.draw_cell(wall_pos, Colors.WALL, surface=self._background)
+        self.draw_cell(self.grid.start, Colors.START, border=True, surface=self._background)
+        self.draw_cell(self.grid.target, Colors.TARGET, border=True, surface=self._background)
+    
+    def _mark_cells(self, positions, color: Tuple[int, int, int]) -> None:
+        """
+        Paint cells onto the state overlay, leaving start and target untouched.
+        
+        Cells are painted without comparing each one against start/target;
+        those two cells are cleared back to transparent once afterwards.
+        
+        Args:
+            positions: Iterable of (x, y) grid positions
+            color: RGB color tuple (r, g, b)
+        """
+        draw_cell = self.draw_cell
+        overlay = self._overlay
+        for pos in positions:
+            draw_cell(pos, color, surface=overlay)
+        
+        draw_cell(self.grid.start, Colors.TRANSPARENT, surface=overlay)
+        draw_cell(self.grid.target, Colors.TRANSPARENT, surface=overlay)
+    
+    def _draw_frame(self) -> None:
+        """Compose the grid area: cached background, state overlay, dynamic obstacles."""
+        self.screen.blit(self._background, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
+        
+        # Draw dynamic obstacles if enabled
+        if self.show_dynamic_obstacles:
+            for dyn_obs in self.grid.dynamic_obstacles:
+                self.draw_cell(dyn_obs, Colors.DYNAMIC_OBSTACLE)
+    
+    def _update_cell(self, pos: Tuple[int, int],
+                     color: Tuple[int, int, int]) -> Optional[pygame.Rect]:
+        """
+        Mark a single cell on the overlay and redraw only that cell on screen.
+        
+        Args:
+            pos: Cell position (x, y) in grid coordinates
+            color: RGB color tuple (r, g, b)
+            
+        Returns:
+            Screen rectangle that changed (a reused scratch Rect), or None for
+            the start/target cells
+        """
+        if pos in self._endpoints:
+            return None
+            
+        self.draw_cell(pos, color, surface=self._overlay)
+        
+        # Recompose just this cell: background, overlay, then any obstacle on top
+        # The scratch Rect is only valid until the next call; callers pass it
+        # straight to pygame.display.update
+        x, y = pos
+        rect = self._dirty_rect
+        rect.x = x * self.cell_size
+        rect.y = y * self.cell_size
+        self.screen.blit(self._background, rect, rect)
+        self.screen.blit(self._overlay, rect, rect)
+        if self.show_dynamic_obstacles and pos in self.grid.dynamic_obstacles:
+            self.draw_cell(pos, Colors.DYNAMIC_OBSTACLE)
+        return rect
     
-    def draw_grid(self) -> None:
-        """Draw the grid with horizontal and vertical lines."""
+    def draw_grid(self, surface: Optional[pygame.Surface] = None) -> None:
+        """
+        Draw the grid with horizontal and vertical lines.
+        
+        A single cell tile (top and left border) is stamped across the grid,
+        doubling the copied area with each blit, so the whole pattern takes
+        O(log width + log height) blits instead of one line call per row and
+        column.
+        
+        Args:
+            surface: Surface to draw on (defaults to the screen)
+        """
+        if surface is None:
+            surface = self.screen
+            
         # Fill background with white
-        self.screen.fill(Colors.WHITE)
-        
-        # Draw vertical grid lines
-        for x in range(self.grid.width + 1):
-            start_pos = (x * self.cell_size, 0)
-            end_pos = (x * self.cell_size, self.grid_height)
-            pygame.draw.line(self.screen, Colors.LIGHT_GRAY, start_pos, end_pos, 1)
-        
-        # Draw horizontal grid lines
-        for y in range(self.grid.height + 1):
-            start_pos = (0, y * self.cell_size)
-            end_pos = (self.grid_width, y * self.cell_size)
-            pygame.draw.line(self.screen, Colors.LIGHT_GRAY, start_pos, end_pos, 1)
+        surface.fill(Colors.WHITE)
+        
+        # One cell with its top and left grid lines
+        cs = self.cell_size
+        tile = pygame.Surface((cs, cs))
+        tile.fill(Colors.WHITE)
+        pygame.draw.line(tile, Colors.LIGHT_GRAY, (0, 0), (0, cs - 1), 1)
+        pygame.draw.line(tile, Colors.LIGHT_GRAY, (0, 0), (cs - 1, 0), 1)
+        surface.blit(tile, (0, 0))
+        
+        # Repeat it across the first row, then repeat that row down the grid
+        width = cs
+        while width < self.grid_width:
+            copy = min(width, self.grid_width - width)
+            surface.blit(surface, (width, 0), pygame.Rect(0, 0, copy, cs))
+            width += copy
+        height = cs
+        while height < self.grid_height:
+            copy = min(height, self.grid_height - height)
+            surface.blit(surface, (0, height), pygame.Rect(0, 0, self.grid_width, copy))
+            height += copy
+        
+        # Closing right and bottom lines
+        pygame.draw.line(surface, Colors.LIGHT_GRAY,
+                         (self.grid_width, 0), (self.grid_width, self.grid_height), 1)
+        pygame.draw.line(surface, Colors.LIGHT_GRAY,
+                         (0, self.grid_height), (self.grid_width, self.grid_height), 1)
     
     def draw_cell(self, pos: Tuple[int, int], color: Tuple[int, int, int], 
-                  border: bool = False) -> None:
+                  border: bool = False, surface: Optional[pygame.Surface] = None) -> None:
         """
         Draw a colored cell at the given position.
         
@@ -112,76 +250,104 @@ class GridVisualizer:
             pos: Cell position (x, y) in grid coordinates
             color: RGB color tuple (r, g, b)
             border: Whether to draw a black border around the cell
+            surface: Surface to draw on (defaults to the screen)
         """
+        if surface is None:
+            surface = self.screen
         x, y = pos
         
-        # Calculate pixel coordinates with small padding
-        rect = pygame.Rect(
-            x * self.cell_size + 1,
-            y * self.cell_size + 1,
-            self.cell_size - 2,
-            self.cell_size - 2
-        )
+        # Calculate pixel coordinates with small padding (reusing one Rect)
+        rect = self._cell_rect
+        rect.x = x * self.cell_size + 1
+        rect.y = y * self.cell_size + 1
         
         # Fill cell with color
-        pygame.draw.rect(self.screen, color, rect)
+        pygame.draw.rect(surface, color, rect)
         
         # Draw border if requested
         if border:
-            pygame.draw.rect(self.screen, Colors.BLACK, rect, 2)
+            pygame.draw.rect(surface, Colors.BLACK, rect, 2)
     
-    def draw_ui_panel(self, algorithm_name: str, result: Optional[SearchResult] = None,
-                     current_step: int = 0, total_steps: int = 0) -> None:
+    def _render_static_panel(self) -> Tuple[pygame.Surface, int, int]:
         """
-        Draw the information panel on the right side of the screen.
+        Render the parts of the information panel that never change.
         
-        Shows:
-        - Application title
-        - Algorithm name
-        - Grid dimensions
-        - Search results (if available)
-        - Animation progress
+        Paints the panel background, application title, algorithm label and
+        grid dimensions once, so frames only need to draw the values that
+        actually change. The legend is added per run by _render_result_panel().
         
-        Args:
-            algorithm_name: Name of the search algorithm
-            result: Search result object (None during initial setup)
-            current_step: Current step in animation
-            total_steps: Total steps in animation
+        Returns:
+            Tuple of (panel-sized surface with the static chrome drawn on it,
+            y of the algorithm name line, y where the search results start),
+            positions in panel coordinates for _render_result_panel()
         """
-        # Draw panel background
-        panel_rect = pygame.Rect(self.grid_width, 0, 350, self.window_height)
-        pygame.draw.rect(self.screen, Colors.UI_BACKGROUND, panel_rect)
-        pygame.draw.rect(self.screen, Colors.BLACK, panel_rect, 2)
+        panel = pygame.Surface((self._panel_rect.width, self._panel_rect.height))
+        panel.fill(Colors.UI_BACKGROUND)
+        pygame.draw.rect(panel, Colors.BLACK, panel.get_rect(), 2)
         
-        # Starting position for text
-        x_offset = self.grid_width + 20
+        # Starting position for text (panel coordinates)
+        x_offset = 20
         y_offset = 20
         line_height = 30
         
         # === Application Title ===
         title_surface = self.font_title.render("GOOD PERFORMANCE", True, Colors.TEXT_COLOR)
-        self.screen.blit(title_surface, (x_offset, y_offset))
+        panel.blit(title_surface, (x_offset, y_offset))
         y_offset += 20
         
         title_surface2 = self.font_title.render("TIME APP", True, Colors.TEXT_COLOR)
-        self.screen.blit(title_surface2, (x_offset, y_offset))
+        panel.blit(title_surface2, (x_offset, y_offset))
         y_offset += 40
         
         # === Algorithm Information ===
         algo_label = self.font_large.render("Algorithm:", True, Colors.TEXT_COLOR)
-        self.screen.blit(algo_label, (x_offset, y_offset))
+        panel.blit(algo_label, (x_offset, y_offset))
+        
         y_offset += line_height
         
-        algo_name = self.font_small.render(algorithm_name, True, (0, 100, 200))
-        self.screen.blit(algo_name, (x_offset + 10, y_offset))
+        # The algorithm name goes on this line (see _render_result_panel)
+        algo_name_y = y_offset
         y_offset += line_height + 10
         
         # === Grid Information ===
         grid_text = f"Grid Size: {self.grid.width} × {self.grid.height}"
         grid_surface = self.font_small.render(grid_text, True, Colors.TEXT_COLOR)
-        self.screen.blit(grid_surface, (x_offset, y_offset))
+        panel.blit(grid_surface, (x_offset, y_offset))
         y_offset += line_height
         
+        # Search results start below the grid size (see _render_result_panel)
+        return panel, algo_name_y, y_offset
+    
+    def _render_result_panel(self, algorithm_name: str,
+                             result: Optional[SearchResult]) -> Tuple[pygame.Surface, int, bool]:
+        """
+        Add the algorithm name, search results and legend to a copy of the
+        static panel.
+        
+        These stay the same for a whole animation, so they are rendered once
+        per run instead of once per frame. On short windows the text and the
+        progress section run into the legend; the legend must then be drawn
+        last every frame so it stays on top, so it is left out of the copy.
+        
+        Args:
+            algorithm_name: Name of the search algorithm
+            result: Search result object (None during initial setup)
+            
+        Returns:
+            Tuple of (panel surface, y offset where the progress section starts,
+            whether the legend has to be drawn on top every frame)
+        """
+        panel = self._panel_chrome.copy()
+        
+        # Positions reserved by _render_static_panel (panel coordinates)
+        x_offset = 20
+        line_height = 30
+        
+        algo_name = self.font_small.render(algorithm_name, True, (0, 100, 200))
+        panel.blit(algo_name, (x_offset + 10, self._algo_name_y))
+        
+        y_offset = self._results_y
+        
         # === Search Results ===
         if result:
             # Show success or failure
@@ -193,20 +359,20 @@ class GridVisualizer:
                 status_color = (200, 0, 0)  # Red for failure
             
             status_surface = self.font_large.render(status_text, True, status_color)
-            self.screen.blit(status_surface, (x_offset, y_offset))
+            panel.blit(status_surface, (x_offset, y_offset))
             y_offset += line_height + 10
             
             # Show path length if path exists
             if result.path:
                 path_text = f"Path Length: {len(result.path)} steps"
                 path_surface = self.font_small.render(path_text, True, Colors.TEXT_COLOR)
-                self.screen.blit(path_surface, (x_offset, y_offset))
+                panel.blit(path_surface, (x_offset, y_offset))
                 y_offset += line_height
             
             # Show number of explored nodes
             explored_text = f"Nodes Explored: {result.total_nodes_explored}"
             explored_surface = self.font_small.render(explored_text, True, Colors.TEXT_COLOR)
-            self.screen.blit(explored_surface, (x_offset, y_offset))
+            panel.blit(explored_surface, (x_offset, y_offset))
             y_offset += line_height
             
             # Show dynamic obstacles if any
@@ -214,11 +380,53 @@ class GridVisualizer:
                 dyn_count = len(result.dynamic_obstacles_encountered)
                 dyn_text = f"Dynamic Obstacles: {dyn_count}"
                 dyn_surface = self.font_small.render(dyn_text, True, Colors.TEXT_COLOR)
-                self.screen.blit(dyn_surface, (x_offset, y_offset))
+                panel.blit(dyn_surface, (x_offset, y_offset))
                 y_offset += line_height
         
+        # The progress section (text line plus bar) follows the results
+        progress_y = y_offset + 10
+        legend_on_top = progress_y + line_height + self._bar_rect.height > self._legend_y
+        if not legend_on_top:
+            self.draw_legend(panel)
+        
+        return panel, progress_y, legend_on_top
+    
+    def draw_ui_panel(self, algorithm_name: str, result: Optional[SearchResult] = None,
+                     current_step: int = 0, total_steps: int = 0) -> None:
+        """
+        Draw the information panel on the right side of the screen.
+        
+        Shows:
+        - Application title
+        - Algorithm name
+        - Grid dimensions
+        - Search results (if available)
+        - Animation progress
+        - Legend
+        
+        Everything except the progress section comes from cached surfaces.
+        
+        Args:
+            algorithm_name: Name of the search algorithm
+            result: Search result object (None during initial setup)
+            current_step: Current step in animation
+            total_steps: Total steps in animation
+        """
+        # Re-render the per-run text only when the algorithm or result changes
+        key = self._result_panel_key
+        if key is None or key[0] != algorithm_name or key[1] is not result:
+            self._result_panel, self._progress_y, self._legend_on_top = (
+                self._render_result_panel(algorithm_name, result))
+            self._result_panel_key = (algorithm_name, result)
+            
+        self.screen.blit(self._result_panel, self._panel_rect)
+        
+        # Starting position for text
+        x_offset = self.grid_width + 20
+        y_offset = self._progress_y
+        line_height = 30
+        
         # === Animation Progress ===
-        y_offset += 10
         if total_steps > 0:
             # Progress text
             progress_text = f"Progress: {current_step}/{total_steps}"
@@ -227,24 +435,34 @@ class GridVisualizer:
             y_offset += line_height
             
             # Progress bar
-            bar_width = 300
-            bar_height = 20
+            bar_background = self._bar_rect
+            bar_background.topleft = (x_offset, y_offset)
             
             # Draw background bar
-            bar_background = pygame.Rect(x_offset, y_offset, bar_width, bar_height)
             pygame.draw.rect(self.screen, Colors.LIGHT_GRAY, bar_background)
             
             # Draw filled portion
             progress_ratio = current_step / total_steps if total_steps > 0 else 0
-            filled_width = int(bar_width * progress_ratio)
-            bar_filled = pygame.Rect(x_offset, y_offset, filled_width, bar_height)
+            bar_filled = self._bar_fill_rect
+            bar_filled.topleft = (x_offset, y_offset)
+            bar_filled.width = int(bar_background.width * progress_ratio)
             pygame.draw.rect(self.screen, (0, 150, 100), bar_filled)
             
             # Draw border
             pygame.draw.rect(self.screen, Colors.BLACK, bar_background, 2)
+            
+        # Legend overlapping the sections above is drawn last, so it stays visible
+        if self._legend_on_top:
+            self.draw_legend()
     
-    def draw_legend(self) -> None:
-        """Draw a color legend at the bottom of the UI panel."""
+    def draw_legend(self, surface: Optional[pygame.Surface] = None) -> None:
+        """
+        Draw a color legend at the bottom of the UI panel.
+        
+        Args:
+            surface: Panel-sized surface to draw on (defaults to the panel
+                area of the screen)
+        """
         # Legend items: (label, color)
         legend_items = [
             ("Start", Colors.START),
@@ -256,12 +474,16 @@ class GridVisualizer:
         ]
         
         # Position legend at bottom of UI panel
-        x_offset = self.grid_width + 20
-        y_offset = self.window_height - 200
+        if surface is None:
+            surface = self.screen
+            x_offset = self.grid_width + 20
+        else:
+            x_offset = 20
+        y_offset = self._legend_y
         
         # Legend title
         legend_title = self.font_small.render("Legend:", True, Colors.TEXT_COLOR)
-        self.screen.blit(legend_title, (x_offset, y_offset))
+        surface.blit(legend_title, (x_offset, y_offset))
         y_offset += 25
         
         # Draw each legend item
@@ -269,12 +491,12 @@ class GridVisualizer:
             # Draw color box
             box_size = 15
             box_rect = pygame.Rect(x_offset, y_offset, box_size, box_size)
-            pygame.draw.rect(self.screen, color, box_rect)
-            pygame.draw.rect(self.screen, Colors.BLACK, box_rect, 1)
+            pygame.draw.rect(surface, color, box_rect)
+            pygame.draw.rect(surface, Colors.BLACK, box_rect, 1)
             
             # Draw label text
             label_surface = self.font_small.render(label, True, Colors.TEXT_COLOR)
-            self.screen.blit(label_surface, (x_offset + 20, y_offset - 2))
+            surface.blit(label_surface, (x_offset + 20, y_offset - 2))
             
             y_offset += 25
     
@@ -299,131 +521,73 @@ class GridVisualizer:
         if explored_animation:
             total_steps = len(explored_animation) + len(result.path)
         
+        # Start from an empty overlay
+        self._overlay.fill(Colors.TRANSPARENT)
+        
         # === PHASE 1: Exploration Animation ===
         if explored_animation:
+            # Draw the first frame in full; later frames only touch what changed
+            self._draw_frame()
+            self.draw_ui_panel(algorithm_name, result, 0, total_steps)
+            pygame.display.flip()
+            
             # Animate exploration in order
             for i, pos in enumerate(explored_animation):
-                # Check for quit event
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return
-                
-                # Draw base grid
-                self.draw_grid()
-                
-                # Draw static walls
-                for wall_pos in self.grid.walls:
-                    self.draw_cell(wall_pos, Colors.WALL)
+                # Keep the event queue serviced and stop if the window was closed;
+                # other events stay queued for the final wait loop
+                pygame.event.pump()
+                if pygame.event.peek(pygame.QUIT):
+                    return
                 
-                # Draw explored nodes up to current step
-                for explored_pos in explored_animation[:i + 1]:
-                    # Don't overwrite start/target
-                    if explored_pos != self.grid.start and explored_pos != self.grid.target:
-                        self.draw_cell(explored_pos, Colors.EXPLORED)
+                # Draw only the newly explored node
+                cell_rect = self._update_cell(pos, Colors.EXPLORED)
                 
-                # Draw start and target on top
-                self.draw_cell(self.grid.start, Colors.START, border=True)
-                self.draw_cell(self.grid.target, Colors.TARGET, border=True)
-                
-                # Draw dynamic obstacles if enabled
-                if self.show_dynamic_obstacles:
-                    for dyn_obs in self.grid.dynamic_obstacles:
-                        self.draw_cell(dyn_obs, Colors.DYNAMIC_OBSTACLE)
-                
-                # Update UI panel and legend
+                # Update UI panel
                 self.draw_ui_panel(algorithm_name, result, i + 1, total_steps)
-                self.draw_legend()
                 
-                # Update display
-                pygame.display.flip()
-                time.sleep(self.animation_delay)
+                # Upload only the changed cell and the panel
+                pygame.display.update([cell_rect, self._panel_rect])
+                self.clock.tick(self.fps)
                 step = i + 1
         else:
             # Fallback: show all explored nodes at once
-            self.draw_grid()
-            for wall_pos in self.grid.walls:
-                self.draw_cell(wall_pos, Colors.WALL)
-            for pos in result.explored:
-                if pos != self.grid.start and pos != self.grid.target:
-                    self.draw_cell(pos, Colors.EXPLORED)
-            self.draw_cell(self.grid.start, Colors.START, border=True)
-            self.draw_cell(self.grid.target, Colors.TARGET, border=True)
             step = len(result.explored)
+            
+        # The path phase shows every explored node, not just the animated ones
+        self._mark_cells(result.explored, Colors.EXPLORED)
         
         # === PHASE 2: Path Animation ===
         if result.path:
             path_steps = len(result.path)
             
+            # Full redraw once with every explored node in place
+            self._draw_frame()
+            self.draw_ui_panel(algorithm_name, result, step, total_steps)
+            pygame.display.flip()
+            
             for i in range(1, path_steps):
-                # Check for quit event
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        return
+                # Keep the event queue serviced and stop if the window was closed;
+                # other events stay queued for the final wait loop
+                pygame.event.pump()
+                if pygame.event.peek(pygame.QUIT):
+                    return
                 
-                # Redraw everything
-                self.draw_grid()
+                # Draw only the next path node (overwrites explored color)
+                cell_rect = self._update_cell(result.path[i], Colors.PATH)
                 
-                # Draw walls
-                for wall_pos in self.grid.walls:
-                    self.draw_cell(wall_pos, Colors.WALL)
-                
-                # Draw all explored nodes
-                for explored_pos in result.explored:
-                    if explored_pos != self.grid.start and explored_pos != self.grid.target:
-                        self.draw_cell(explored_pos, Colors.EXPLORED)
-                
-                # Draw path up to current step (overwrites explored color)
-                for path_pos in result.path[:i + 1]:
-                    if path_pos != self.grid.start and path_pos != self.grid.target:
-                        self.draw_cell(path_pos, Colors.PATH)
-                
-                # Draw start and target on top
-                self.draw_cell(self.grid.start, Colors.START, border=True)
-                self.draw_cell(self.grid.target, Colors.TARGET, border=True)
-                
-                # Draw dynamic obstacles if enabled
-                if self.show_dynamic_obstacles:
-                    for dyn_obs in self.grid.dynamic_obstacles:
-                        self.draw_cell(dyn_obs, Colors.DYNAMIC_OBSTACLE)
-                
-                # Update UI and legend
+                # Update UI panel
                 self.draw_ui_panel(algorithm_name, result, step + i, total_steps)
-                self.draw_legend()
                 
-                # Update display
-                pygame.display.flip()
-                time.sleep(self.animation_delay)
+                # Upload only the changed cell and the panel
+                pygame.display.update([cell_rect, self._panel_rect])
+                self.clock.tick(self.fps)
         
         # === FINAL STATE: Show complete result ===
-        self.draw_grid()
-        
-        # Draw walls
-        for wall_pos in self.grid.walls:
-            self.draw_cell(wall_pos, Colors.WALL)
-        
-        # Draw all explored nodes
-        for explored_pos in result.explored:
-            if explored_pos != self.grid.start and explored_pos != self.grid.target:
-                self.draw_cell(explored_pos, Colors.EXPLORED)
-        
-        # Draw complete final path
-        if result.path:
-            for path_pos in result.path:
-                if path_pos != self.grid.start and path_pos != self.grid.target:
-                    self.draw_cell(path_pos, Colors.PATH)
-        
-        # Draw start and target
-        self.draw_cell(self.grid.start, Colors.START, border=True)
-        self.draw_cell(self.grid.target, Colors.TARGET, border=True)
-        
-        # Draw dynamic obstacles
-        if self.show_dynamic_obstacles:
-            for dyn_obs in self.grid.dynamic_obstacles:
-                self.draw_cell(dyn_obs, Colors.DYNAMIC_OBSTACLE)
+        # The overlay already holds every explored node and the full path
+        self._draw_frame()
         
         # Final UI update
         self.draw_ui_panel(algorithm_name, result, total_steps, total_steps)
-        self.draw_legend()
         
         pygame.display.flip()
         